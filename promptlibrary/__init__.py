@@ -5,20 +5,34 @@ A Python package for managing and enhancing prompts for language models.
 from .llm import (
     generate_prompt,
     generate_audio_prompt,
+    generate_prompts_batch,
     create_prompt,
     create_audio_prompt,
     edit_prompt,
     edit_audio_prompt,
+    acreate_prompt,
+    acreate_audio_prompt,
+    aedit_prompt,
+    aedit_audio_prompt,
+    batch_create_prompts,
+    submit_batch,
+    poll_batch,
+    fetch_batch_results,
     generate_schema,
     LLMConfig,
     LLMProvider,
     LLMClient
 )
 
+from .cache import LLMCache, SemanticCache
+
 from .schema import (
     Schema,
     SchemaProperty,
-    FUNCTION_META_SCHEMA
+    FUNCTION_META_SCHEMA,
+    VALIDATE_FUNCTION,
+    function_meta_schema,
+    compile_validator
 )
 
 from .prompts.system import FUNCTION_SCHEMA_GENERATOR
@@ -26,10 +40,32 @@ from .prompts.system import FUNCTION_SCHEMA_GENERATOR
 __version__ = "0.1.0"
 
 __all__ = [
+    'generate_prompt',
+    'generate_audio_prompt',
+    'generate_prompts_batch',
+    'create_prompt',
+    'create_audio_prompt',
+    'edit_prompt',
+    'edit_audio_prompt',
+    'acreate_prompt',
+    'acreate_audio_prompt',
+    'aedit_prompt',
+    'aedit_audio_prompt',
+    'batch_create_prompts',
+    'submit_batch',
+    'poll_batch',
+    'fetch_batch_results',
+    'generate_schema',
+    'LLMConfig',
+    'LLMProvider',
+    'LLMClient',
+    'LLMCache',
+    'SemanticCache',
     'Schema',
     'SchemaProperty',
     'FUNCTION_META_SCHEMA',
-    'FUNCTION_SCHEMA_GENERATOR',
-    'generate_schema',
-    'edit_audio_prompt'
+    'VALIDATE_FUNCTION',
+    'function_meta_schema',
+    'compile_validator',
+    'FUNCTION_SCHEMA_GENERATOR'
 ]
@@ -0,0 +1,263 @@
+"""Module for caching LLM responses."""
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, List, Any, Callable, cast
+import hashlib
+import json
+import threading
+
+try:
+    import orjson
+
+    def _dumps_sorted(obj: Any) -> bytes:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+except ImportError:
+    def _dumps_sorted(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, default=str).encode("utf-8")
+
+@lru_cache(maxsize=1)
+def _load_faiss() -> Any:
+    """Import faiss once, returning None if it is not installed."""
+    try:
+        import faiss
+    except ImportError:
+        return None
+    return faiss
+
+class LLMCache:
+    """In-memory exact-match cache for LLM responses with LRU eviction."""
+    
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, str]], temperature: float,
+                 **params: Any) -> str:
+        """Build a stable cache key for a request.
+        
+        Args:
+            model: The model the request is sent to
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: The sampling temperature of the request
+            **params: Any other request parameters that affect the response
+            
+        Returns:
+            str: A SHA-256 hex digest identifying the request
+        """
+        request = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "params": params,
+        }
+        return hashlib.sha256(_dumps_sorted(request)).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss."""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and size counters for the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class _SemanticPartition:
+    """Embeddings and responses stored for one request context."""
+    
+    def __init__(self, np: Any, dimension: int):
+        self._np = np
+        self.size = 0
+        self.embeddings = np.empty((16, dimension), dtype=np.float32)
+        self.responses: List[str] = []
+        self.index: Any = None
+
+    def add(self, embedding: Any, response: str) -> None:
+        """Append a normalized embedding and its response."""
+        if self.size == len(self.embeddings):
+            grown = self._np.empty(
+                (self.size * 2, self.embeddings.shape[1]), dtype=self._np.float32
+            )
+            grown[:self.size] = self.embeddings
+            self.embeddings = grown
+        self.embeddings[self.size] = embedding
+        self.responses.append(response)
+        self.size += 1
+        if self.index is not None:
+            self.index.add(embedding.reshape(1, -1))
+
+    def search(self, query: Any) -> "tuple[float, int]":
+        """Return the best cosine similarity and its position."""
+        if self.index is not None:
+            scores, positions = self.index.search(query.reshape(1, -1), 1)
+            return float(scores[0][0]), int(positions[0][0])
+        scores = self.embeddings[:self.size] @ query
+        best = int(self._np.argmax(scores))
+        return float(scores[best]), best
+
+class SemanticCache:
+    """Cache that serves responses for semantically similar requests.
+    
+    Requests are partitioned by a namespace (typically the model and system
+    prompt) and matched on the embedding of their varying text. Texts longer
+    than max_chars are not cached: the embedding model truncates its input
+    (all-MiniLM-L6-v2 reads 256 word pieces, roughly 1000 characters), so
+    texts differing only past that point would match each other. Requires
+    the optional ``numpy`` and ``sentence-transformers`` packages; ``faiss``
+    is used for large partitions when it is installed.
+    """
+    
+    def __init__(self, threshold: float = 0.92,
+                 model_name: str = "all-MiniLM-L6-v2",
+                 embedder: Optional[Callable[[str], Any]] = None,
+                 max_size: int = 10000,
+                 faiss_threshold: int = 1000,
+                 max_chars: int = 1000):
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError(
+                "SemanticCache requires numpy: pip install promptlibrary[semantic]"
+            ) from e
+        self._np = numpy
+        self.threshold = threshold
+        self.model_name = model_name
+        self.max_size = max_size
+        self.faiss_threshold = faiss_threshold
+        self.max_chars = max_chars
+        self.hits = 0
+        self.misses = 0
+        self._embedder = embedder
+        self._partitions: Dict[str, _SemanticPartition] = {}
+        self._lock = threading.Lock()
+
+    def _load_embedder(self) -> Callable[[str], Any]:
+        """Load the sentence-transformers model on first use."""
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "SemanticCache requires sentence-transformers: "
+                "pip install promptlibrary[semantic]"
+            ) from e
+        return cast(Callable[[str], Any], SentenceTransformer(self.model_name).encode)
+
+    def accepts(self, text: str) -> bool:
+        """Return whether a text is short enough to be embedded without truncation."""
+        return len(text) <= self.max_chars
+
+    def embed(self, text: str) -> Any:
+        """Return the L2-normalized embedding of a text as a numpy array."""
+        if self._embedder is None:
+            self._embedder = self._load_embedder()
+        vector = self._np.asarray(self._embedder(text), dtype=self._np.float32).ravel()
+        norm = self._np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, namespace: str, text: str, embedding: Any = None) -> Optional[str]:
+        """Return the cached response most similar to a text, if close enough.
+        
+        Args:
+            namespace: Partition the lookup is restricted to
+            text: The text to compare against stored requests
+            embedding: The text's embedding from embed(), if already computed
+            
+        Returns:
+            Optional[str]: The cached response, or None on a miss
+        """
+        partition = self._partitions.get(namespace)
+        if partition is None or partition.size == 0 or not self.accepts(text):
+            self.misses += 1
+            return None
+        query = self.embed(text) if embedding is None else embedding
+        with self._lock:
+            score, position = partition.search(query)
+            if score >= self.threshold:
+                self.hits += 1
+                return partition.responses[position]
+            self.misses += 1
+            return None
+
+    def set(self, namespace: str, text: str, response: str, embedding: Any = None) -> None:
+        """Store a response for a text; ignored once the cache is full.
+        
+        Pass the embedding returned by embed() to avoid computing it again.
+        """
+        if not self.accepts(text):
+            return
+        if embedding is None:
+            embedding = self.embed(text)
+        with self._lock:
+            if len(self) >= self.max_size:
+                return
+            partition = self._partitions.get(namespace)
+            if partition is None:
+                partition = _SemanticPartition(self._np, embedding.shape[0])
+                self._partitions[namespace] = partition
+            partition.add(embedding, response)
+            if partition.index is None and partition.size > self.faiss_threshold:
+                partition.index = self._build_index(partition)
+
+    def _build_index(self, partition: _SemanticPartition) -> Any:
+        """Build a FAISS inner-product index for a partition, if available."""
+        faiss = _load_faiss()
+        if faiss is None:
+            return None
+        index = faiss.IndexFlatIP(partition.embeddings.shape[1])
+        index.add(partition.embeddings[:partition.size])
+        return index
+
+    def clear(self) -> None:
+        """Remove all cached responses and reset the statistics."""
+        with self._lock:
+            self._partitions.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and size counters for the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self),
+        }
+
+    def __len__(self) -> int:
+        return sum(partition.size for partition in self._partitions.values())
@@ -1,24 +1,57 @@
 """Module for handling LLM interactions."""
-from typing import Optional, Union, List, Dict, Any
+from typing import Optional, Union, List, Dict, Any, AsyncIterator, Iterator, Tuple, TYPE_CHECKING, cast
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from functools import lru_cache
+import asyncio
+import hashlib
+import importlib.util
 import os
+import time
 from enum import Enum
-from openai import OpenAI
 import json
 
+try:
+    import orjson
+
+    def _json_loads(data: str) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data: str) -> Any:
+        return json.loads(data)
+
+if TYPE_CHECKING:
+    import httpx
+
+from .cache import LLMCache, SemanticCache
+from .prompts.system import (
+    PROMPT_GENERATOR,
+    PROMPT_EDITOR,
+    AUDIO_PROMPT_GENERATOR,
+    AUDIO_PROMPT_EDITOR
+)
+
 class LLMProvider(Enum):
     OPENAI = "openai"
     OLLAMA = "ollama"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LLMConfig:
-    """Configuration for LLM client."""
+    """Configuration for LLM client.
+    
+    Configs are immutable and hashable; use dataclasses.replace to derive a
+    modified copy.
+    """
     provider: LLMProvider
     model: str
     api_key: Optional[str] = None
     base_url: Optional[str] = None
     temperature: float = 0.7
     max_tokens: Optional[int] = None
+    cacheable: bool = False
+    semantic_cache: bool = False
+    timeout: float = 60.0
+    max_retries: int = 5
 
     @classmethod
     def default_openai(cls) -> 'LLMConfig':
@@ -37,73 +70,526 @@ class LLMConfig:
             model="llama3.2"
         )
 
+@lru_cache(maxsize=32)
+def _stable_hash(text: str) -> str:
+    """Return a short, stable hash of a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+def _openai_extra_body(messages: List[Dict[str, str]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the OpenAI extra_body, routing requests that share a system prompt together.
+    
+    OpenAI uses prompt_cache_key to send requests with a common prefix to the
+    same cache, improving prompt-cache hit rates.
+    """
+    extra_body = dict(kwargs.pop("extra_body", None) or {})
+    if messages and messages[0].get("role") == "system":
+        extra_body.setdefault("prompt_cache_key", _stable_hash(messages[0]["content"]))
+    return extra_body
+
+@lru_cache(maxsize=1)
+def _http2_available() -> bool:
+    """Return whether the optional h2 package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
 class LLMClient:
     """Client for interacting with LLMs."""
+
+    # HTTP connection pools are shared at class level so that every LLMClient
+    # reuses the same keep-alive connections instead of opening new ones.
+    _http_client: Optional["httpx.Client"] = None
+    _ollama_clients: Dict[tuple, Any] = {}
+    # Async clients are bound to the event loop they were created on. They
+    # are closed once no async_session on that loop is open, since an open
+    # pool keeps its loop alive.
+    _async_loop_clients: Dict[asyncio.AbstractEventLoop, Dict[tuple, Any]] = {}
+    _async_users: Dict[asyncio.AbstractEventLoop, int] = {}
+
+    # Exact-match response cache shared by all clients. Only deterministic
+    # requests (temperature 0) or configs marked cacheable are stored.
+    _response_cache = LLMCache()
+    # Embedding-based cache for near-duplicate requests, created on first use
+    # by configs with semantic_cache enabled.
+    _semantic_cache: Optional[SemanticCache] = None
     
     def __init__(self, config: LLMConfig):
         self.config = config
-        if config.provider == LLMProvider.OPENAI:
-            self.client = OpenAI(api_key=config.api_key)
-        elif config.provider == LLMProvider.OLLAMA:
+        self._setup_client()
+
+    @classmethod
+    def _get_http_client(cls) -> "httpx.Client":
+        """Return the shared, connection-pooled HTTP client for OpenAI."""
+        if cls._http_client is None:
+            import httpx
+            cls._http_client = httpx.Client(
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+                http2=_http2_available(),
+            )
+        return cls._http_client
+
+    @classmethod
+    def _get_ollama_client(cls, config: LLMConfig) -> Any:
+        """Return the shared Ollama client for the config's host and timeouts."""
+        key = (config.base_url, config.timeout, config.max_retries)
+        if key not in cls._ollama_clients:
+            import httpx
+            import ollama
+            # The transport retries failed connections to the Ollama server.
+            cls._ollama_clients[key] = ollama.Client(
+                host=config.base_url,
+                timeout=config.timeout,
+                transport=httpx.HTTPTransport(
+                    retries=config.max_retries,
+                    limits=httpx.Limits(max_keepalive_connections=10, max_connections=10),
+                ),
+            )
+        return cls._ollama_clients[key]
+
+    @classmethod
+    def _loop_clients(cls) -> Dict[tuple, Any]:
+        """Return the async clients created on the running event loop."""
+        return cls._async_loop_clients.setdefault(asyncio.get_running_loop(), {})
+
+    @classmethod
+    @asynccontextmanager
+    async def async_session(cls) -> AsyncIterator[None]:
+        """Keep the running loop's async connection pools open while in use.
+        
+        Every async call holds a session for its duration, and the pools are
+        closed when the last session on the loop exits. Wrap a sequence of
+        awaits in ``async with LLMClient.async_session():`` so they reuse
+        keep-alive connections instead of reconnecting for each call.
+        """
+        loop = asyncio.get_running_loop()
+        cls._async_users[loop] = cls._async_users.get(loop, 0) + 1
+        try:
+            yield
+        finally:
+            cls._async_users[loop] -= 1
+            if not cls._async_users[loop]:
+                del cls._async_users[loop]
+                await cls._aclose_loop_clients(loop)
+
+    @classmethod
+    async def _aclose_loop_clients(cls, loop: asyncio.AbstractEventLoop) -> None:
+        """Close the connection pools created on the given event loop."""
+        clients = cls._async_loop_clients.pop(loop, {})
+        for key, client in clients.items():
+            if key[0] == "http":
+                await client.aclose()
+            elif key[0] == "ollama":
+                await client.close()
+            # AsyncOpenAI wrappers share the "http" pool closed above.
+
+    @classmethod
+    def _get_async_http_client(cls) -> "httpx.AsyncClient":
+        """Return the connection-pooled async HTTP client for the running loop."""
+        clients = cls._loop_clients()
+        if ("http",) not in clients:
+            import httpx
+            clients[("http",)] = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+                http2=_http2_available(),
+            )
+        return cast("httpx.AsyncClient", clients[("http",)])
+
+    @classmethod
+    def _get_async_ollama_client(cls, config: LLMConfig) -> Any:
+        """Return the async Ollama client for the config and running loop."""
+        clients = cls._loop_clients()
+        key = ("ollama", config.base_url, config.timeout, config.max_retries)
+        if key not in clients:
+            import httpx
             import ollama
-            self.client = ollama
+            clients[key] = ollama.AsyncClient(
+                host=config.base_url,
+                timeout=config.timeout,
+                transport=httpx.AsyncHTTPTransport(
+                    retries=config.max_retries,
+                    limits=httpx.Limits(max_keepalive_connections=10, max_connections=10),
+                ),
+            )
+        return clients[key]
+
+    def _get_async_client(self) -> Any:
+        """Return the async provider client for the running event loop."""
+        if self.config.provider == LLMProvider.OLLAMA:
+            return self._get_async_ollama_client(self.config)
+        clients = self._loop_clients()
+        key = ("openai", self.config)
+        if key not in clients:
+            from openai import AsyncOpenAI
+            clients[key] = AsyncOpenAI(
+                api_key=self.config.api_key,
+                timeout=self.config.timeout,
+                max_retries=self.config.max_retries,
+                http_client=self._get_async_http_client(),
+            )
+        return clients[key]
+
+    def _setup_client(self) -> None:
+        """Create the provider client on top of the shared connection pools."""
+        if self.config.provider == LLMProvider.OPENAI:
+            from openai import OpenAI
+            # The SDK retries rate limits, 5xx responses, timeouts and
+            # connection errors with exponential backoff and jitter.
+            self.client = OpenAI(
+                api_key=self.config.api_key,
+                timeout=self.config.timeout,
+                max_retries=self.config.max_retries,
+                http_client=self._get_http_client(),
+            )
+        elif self.config.provider == LLMProvider.OLLAMA:
+            self.client = self._get_ollama_client(self.config)
         else:
-            raise ValueError(f"Unsupported provider: {config.provider}")
+            raise ValueError(f"Unsupported provider: {self.config.provider}")
+
+    @classmethod
+    def cache_stats(cls) -> Dict[str, int]:
+        """Return hit/miss statistics for the shared response cache."""
+        return cls._response_cache.stats
+
+    @classmethod
+    def _get_semantic_cache(cls) -> SemanticCache:
+        """Return the shared semantic cache, creating it on first use."""
+        if cls._semantic_cache is None:
+            cls._semantic_cache = SemanticCache()
+        return cls._semantic_cache
+
+    def _semantic_key(self, messages: List[Dict[str, str]], kwargs: Dict[str, Any],
+                      semantic_text: Optional[str]) -> Optional[Tuple[str, str]]:
+        """Return the semantic-cache namespace and the text to embed, if enabled.
+        
+        Only semantic_text, which must end the last message, is embedded. The
+        rest of the request, including the start of the last message, selects
+        the namespace so that it has to match exactly.
+        """
+        if not self.config.semantic_cache or not messages:
+            return None
+        content = messages[-1]["content"]
+        if semantic_text is None or not content.endswith(semantic_text):
+            semantic_text = content
+        context = [*messages[:-1], {**messages[-1], "content": content[:len(content) - len(semantic_text)]}]
+        namespace = LLMCache.make_key(
+            self.config.model,
+            context,
+            self.config.temperature,
+            provider=self.config.provider.value,
+            max_tokens=self.config.max_tokens,
+            **kwargs
+        )
+        return namespace, semantic_text
+
+    def _lookup_cache(self, cache_key: Optional[str],
+                      semantic: Optional[Tuple[str, str]]) -> Tuple[Optional[str], Any]:
+        """Return a cached response for a request, if any cache has one.
+        
+        The second item is the semantic-cache embedding of the request, or
+        None, to be passed on to _store_cache so it is computed only once.
+        """
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached, None
+        if semantic is not None:
+            cache = self._get_semantic_cache()
+            namespace, text = semantic
+            if not cache.accepts(text):
+                return None, None
+            embedding = cache.embed(text)
+            return cache.get(namespace, text, embedding), embedding
+        return None, None
 
-    def generate(self, messages: List[Dict[str, str]], **kwargs) -> str:
+    def _store_cache(self, cache_key: Optional[str], semantic: Optional[Tuple[str, str]],
+                     response: Optional[str], embedding: Any = None) -> None:
+        """Store a response in every cache enabled for the request."""
+        if response is None:
+            return
+        if cache_key is not None:
+            self._response_cache.set(cache_key, response)
+        if semantic is not None:
+            namespace, text = semantic
+            self._get_semantic_cache().set(namespace, text, response, embedding)
+
+    def _cache_key(self, messages: List[Dict[str, str]], kwargs: Dict[str, Any]) -> Optional[str]:
+        """Return the response-cache key for a request, or None if it is not cacheable."""
+        if not (self.config.cacheable or self.config.temperature == 0):
+            return None
+        return LLMCache.make_key(
+            self.config.model,
+            messages,
+            self.config.temperature,
+            provider=self.config.provider.value,
+            max_tokens=self.config.max_tokens,
+            **kwargs
+        )
+
+    def generate(self, messages: List[Dict[str, str]], semantic_text: Optional[str] = None,
+                 **kwargs: Any) -> str:
         """Generate a response from the LLM.
         
+        Deterministic requests are served from the shared response cache
+        when an identical request has been made before, and configs with
+        semantic_cache enabled also reuse responses to near-duplicate requests.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            semantic_text: The varying end of the last message, the only part
+                embedded for the semantic cache (default: the whole message)
+            **kwargs: Additional arguments to pass to the LLM
+            
+        Returns:
+            str: The generated response
+        """
+        return "".join(self.generate_stream(messages, semantic_text, **kwargs))
+
+    def generate_stream(self, messages: List[Dict[str, str]], semantic_text: Optional[str] = None,
+                        **kwargs: Any) -> Iterator[str]:
+        """Stream a response from the LLM as it is generated.
+        
+        Cached responses are yielded as a single chunk. A streamed response is
+        added to the caches once it has been fully consumed.
+        
         Args:
             messages: List of message dictionaries with 'role' and 'content'
+            semantic_text: The varying end of the last message, the only part
+                embedded for the semantic cache (default: the whole message)
+            **kwargs: Additional arguments to pass to the LLM
+            
+        Yields:
+            str: Successive pieces of the generated response
+        """
+        cache_key = self._cache_key(messages, kwargs)
+        semantic = self._semantic_key(messages, kwargs, semantic_text)
+        cached, embedding = self._lookup_cache(cache_key, semantic)
+        if cached is not None:
+            yield cached
+            return
+        
+        chunks = []
+        for chunk in self._stream(messages, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        self._store_cache(cache_key, semantic, "".join(chunks), embedding)
+
+    async def agenerate(self, messages: List[Dict[str, str]], semantic_text: Optional[str] = None,
+                        **kwargs: Any) -> str:
+        """Asynchronously generate a response from the LLM.
+        
+        The connection pool is closed after the call unless an
+        async_session() is held around it.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            semantic_text: The varying end of the last message, the only part
+                embedded for the semantic cache (default: the whole message)
             **kwargs: Additional arguments to pass to the LLM
             
         Returns:
             str: The generated response
         """
+        cache_key = self._cache_key(messages, kwargs)
+        semantic = self._semantic_key(messages, kwargs, semantic_text)
+        cached, embedding = self._lookup_cache(cache_key, semantic)
+        if cached is not None:
+            return cached
+        
+        async with self.async_session():
+            response = await self._acomplete(messages, **kwargs)
+        self._store_cache(cache_key, semantic, response, embedding)
+        return response
+
+    async def _acomplete(self, messages: List[Dict[str, str]], **kwargs: Any) -> str:
+        """Send a request to the provider without blocking the event loop."""
+        client = self._get_async_client()
         if self.config.provider == LLMProvider.OPENAI:
-            completion = self.client.chat.completions.create(
+            extra_body = _openai_extra_body(messages, kwargs)
+            completion = await client.chat.completions.create(
                 model=self.config.model,
                 messages=messages,
                 temperature=self.config.temperature,
                 max_tokens=self.config.max_tokens,
+                extra_body=extra_body,
                 **kwargs
             )
-            return completion.choices[0].message.content
+            return cast(str, completion.choices[0].message.content)
         
         elif self.config.provider == LLMProvider.OLLAMA:
-            response = self.client.chat(
+            response = await client.chat(
                 model=self.config.model,
                 messages=messages,
                 **kwargs
             )
-            return response['message']['content']
+            return cast(str, response['message']['content'])
+
+    def _stream(self, messages: List[Dict[str, str]], **kwargs: Any) -> Iterator[str]:
+        """Send a streaming request to the provider and yield the response text."""
+        if self.config.provider == LLMProvider.OPENAI:
+            extra_body = _openai_extra_body(messages, kwargs)
+            stream = cast(Iterator[Any], self.client.chat.completions.create(
+                model=self.config.model,
+                messages=messages,
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+                extra_body=extra_body,
+                stream=True,
+                **kwargs
+            ))
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        
+        elif self.config.provider == LLMProvider.OLLAMA:
+            stream = self.client.chat(
+                model=self.config.model,
+                messages=messages,
+                stream=True,
+                **kwargs
+            )
+            for chunk in stream:
+                if chunk['message']['content']:
+                    yield chunk['message']['content']
+
+@lru_cache(maxsize=8)
+def _get_client(
+    provider: LLMProvider,
+    model: str,
+    api_key: Optional[str],
+    base_url: Optional[str],
+    temperature: float,
+    max_tokens: Optional[int],
+    cacheable: bool = False,
+    semantic_cache: bool = False,
+    timeout: float = 60.0,
+    max_retries: int = 5,
+) -> LLMClient:
+    """Return a memoized LLMClient for the given configuration values."""
+    return LLMClient(LLMConfig(
+        provider=provider,
+        model=model,
+        api_key=api_key,
+        base_url=base_url,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        cacheable=cacheable,
+        semantic_cache=semantic_cache,
+        timeout=timeout,
+        max_retries=max_retries
+    ))
+
+def _client_for(config: LLMConfig) -> LLMClient:
+    """Return the memoized LLMClient matching the given configuration."""
+    return _get_client(
+        config.provider,
+        config.model,
+        config.api_key,
+        config.base_url,
+        config.temperature,
+        config.max_tokens,
+        config.cacheable,
+        config.semantic_cache,
+        config.timeout,
+        config.max_retries
+    )
+
+# System messages are identical for every call of a helper, so they are built
+# once and shared by every request list. They must not be mutated.
+_PROMPT_GENERATOR_MESSAGE = {"role": "system", "content": PROMPT_GENERATOR.content}
+_PROMPT_EDITOR_MESSAGE = {"role": "system", "content": PROMPT_EDITOR.content}
+_AUDIO_PROMPT_GENERATOR_MESSAGE = {"role": "system", "content": AUDIO_PROMPT_GENERATOR.content}
+_AUDIO_PROMPT_EDITOR_MESSAGE = {"role": "system", "content": AUDIO_PROMPT_EDITOR.content}
+
+def _create_messages(system_message: Dict[str, str], task_or_prompt: str) -> List[Dict[str, str]]:
+    """Build the chat messages for a prompt-creation request."""
+    return [
+        system_message,
+        {
+            "role": "user",
+            "content": "Task, Goal, or Current Prompt:\n" + task_or_prompt,
+        },
+    ]
+
+# Static lead-in for edit requests. Keeping it ahead of the variable parts
+# extends the prefix shared between calls, which provider prompt caches reuse.
+_EDIT_INSTRUCTIONS = """Edit the current prompt below according to the change description, following your guidelines and output structure."""
+
+def _edit_messages(system_message: Dict[str, str], prompt: str,
+                   change_description: str) -> List[Dict[str, str]]:
+    """Build the chat messages for a prompt-editing request."""
+    return [
+        system_message,
+        {
+            "role": "user",
+            "content": f"""{_EDIT_INSTRUCTIONS}
+
+Current Prompt:
+{prompt}
+
+Change Description:
+{change_description}""",
+        },
+    ]
+
+# Local fallback for trivially short tasks, following the structure that
+# PROMPT_GENERATOR asks the model to produce.
+_LOCAL_PROMPT_TEMPLATE = """{task}
+
+Think through the task step by step before giving your final answer.
+
+# Output Format
+
+Respond with a clear, concise answer in the format that best suits the task."""
+
+@lru_cache(maxsize=1)
+def _token_encoder() -> Any:
+    """Return a tiktoken encoder, or None if tiktoken is not usable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        # The encoding file is downloaded on first use, which fails offline.
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+def _count_tokens(text: str) -> int:
+    """Count tokens with tiktoken when available, otherwise count words."""
+    encoder = _token_encoder()
+    if encoder is None:
+        return len(text.split())
+    return len(encoder.encode(text))
+
+def _local_prompt(task_or_prompt: str) -> str:
+    """Fill the local prompt template for a short task without calling an LLM."""
+    task = task_or_prompt.strip()
+    task = task[:1].upper() + task[1:]
+    if task and task[-1] not in ".!?:":
+        task += "."
+    return _LOCAL_PROMPT_TEMPLATE.format(task=task)
 
-def create_prompt(task_or_prompt: str, config: Optional[LLMConfig] = None) -> str:
+def create_prompt(task_or_prompt: str, config: Optional[LLMConfig] = None,
+                  skip_llm_below_tokens: int = 0) -> str:
     """Create a new prompt based on a task description.
     
     Args:
         task_or_prompt: Description of the task or existing prompt to improve
         config: Optional LLM configuration. If not provided, uses default OpenAI config
+        skip_llm_below_tokens: Tasks shorter than this many tokens are filled into
+            a local template instead of calling the LLM. Disabled by default
         
     Returns:
         str: The generated prompt
     """
-    from .prompts.system import PROMPT_GENERATOR
+    if skip_llm_below_tokens and _count_tokens(task_or_prompt) < skip_llm_below_tokens:
+        return _local_prompt(task_or_prompt)
     
     if config is None:
         config = LLMConfig.default_openai()
     
-    client = LLMClient(config)
-    return client.generate([
-        {
-            "role": "system",
-            "content": PROMPT_GENERATOR.content,
-        },
-        {
-            "role": "user",
-            "content": "Task, Goal, or Current Prompt:\n" + task_or_prompt,
-        },
-    ])
+    client = _client_for(config)
+    return client.generate(
+        _create_messages(_PROMPT_GENERATOR_MESSAGE, task_or_prompt), semantic_text=task_or_prompt
+    )
 
 def edit_prompt(prompt: str, change_description: str, config: Optional[LLMConfig] = None) -> str:
     """Edit an existing prompt to improve its effectiveness.
@@ -116,26 +602,14 @@ def edit_prompt(prompt: str, change_description: str, config: Optional[LLMConfig
     Returns:
         str: The improved prompt with reasoning analysis
     """
-    from .prompts.system import PROMPT_EDITOR
-    
     if config is None:
         config = LLMConfig.default_openai()
     
-    client = LLMClient(config)
-    return client.generate([
-        {
-            "role": "system",
-            "content": PROMPT_EDITOR.content,
-        },
-        {
-            "role": "user",
-            "content": f"""Current Prompt:
-{prompt}
-
-Change Description:
-{change_description}""",
-        },
-    ])
+    client = _client_for(config)
+    return client.generate(
+        _edit_messages(_PROMPT_EDITOR_MESSAGE, prompt, change_description),
+        semantic_text=change_description
+    )
 
 def create_audio_prompt(task_or_prompt: str, config: Optional[LLMConfig] = None) -> str:
     """Create a new prompt optimized for audio output based on a task description.
@@ -147,22 +621,13 @@ def create_audio_prompt(task_or_prompt: str, config: Optional[LLMConfig] = None)
     Returns:
         str: The generated audio-optimized prompt
     """
-    from .prompts.system import AUDIO_PROMPT_GENERATOR
-    
     if config is None:
         config = LLMConfig.default_openai()
     
-    client = LLMClient(config)
-    return client.generate([
-        {
-            "role": "system",
-            "content": AUDIO_PROMPT_GENERATOR.content,
-        },
-        {
-            "role": "user",
-            "content": "Task, Goal, or Current Prompt:\n" + task_or_prompt,
-        },
-    ])
+    client = _client_for(config)
+    return client.generate(
+        _create_messages(_AUDIO_PROMPT_GENERATOR_MESSAGE, task_or_prompt), semantic_text=task_or_prompt
+    )
 
 def edit_audio_prompt(prompt: str, change_description: str, config: Optional[LLMConfig] = None) -> str:
     """Edit an existing audio prompt to improve its effectiveness.
@@ -175,26 +640,190 @@ def edit_audio_prompt(prompt: str, change_description: str, config: Optional[LLM
     Returns:
         str: The improved audio prompt with reasoning analysis
     """
-    from .prompts.system import AUDIO_PROMPT_EDITOR
+    if config is None:
+        config = LLMConfig.default_openai()
+    
+    client = _client_for(config)
+    return client.generate(
+        _edit_messages(_AUDIO_PROMPT_EDITOR_MESSAGE, prompt, change_description),
+        semantic_text=change_description
+    )
+
+async def acreate_prompt(task_or_prompt: str, config: Optional[LLMConfig] = None,
+                         skip_llm_below_tokens: int = 0) -> str:
+    """Asynchronous version of create_prompt."""
+    if skip_llm_below_tokens and _count_tokens(task_or_prompt) < skip_llm_below_tokens:
+        return _local_prompt(task_or_prompt)
     
     if config is None:
         config = LLMConfig.default_openai()
     
-    client = LLMClient(config)
-    return client.generate([
-        {
-            "role": "system",
-            "content": AUDIO_PROMPT_EDITOR.content,
-        },
-        {
-            "role": "user",
-            "content": f"""Current Prompt:
-{prompt}
+    client = _client_for(config)
+    return await client.agenerate(
+        _create_messages(_PROMPT_GENERATOR_MESSAGE, task_or_prompt), semantic_text=task_or_prompt
+    )
 
-Change Description:
-{change_description}""",
-        },
-    ])
+async def aedit_prompt(prompt: str, change_description: str, config: Optional[LLMConfig] = None) -> str:
+    """Asynchronous version of edit_prompt."""
+    if config is None:
+        config = LLMConfig.default_openai()
+    
+    client = _client_for(config)
+    return await client.agenerate(
+        _edit_messages(_PROMPT_EDITOR_MESSAGE, prompt, change_description),
+        semantic_text=change_description
+    )
+
+async def acreate_audio_prompt(task_or_prompt: str, config: Optional[LLMConfig] = None) -> str:
+    """Asynchronous version of create_audio_prompt."""
+    if config is None:
+        config = LLMConfig.default_openai()
+    
+    client = _client_for(config)
+    return await client.agenerate(
+        _create_messages(_AUDIO_PROMPT_GENERATOR_MESSAGE, task_or_prompt), semantic_text=task_or_prompt
+    )
+
+async def aedit_audio_prompt(prompt: str, change_description: str, config: Optional[LLMConfig] = None) -> str:
+    """Asynchronous version of edit_audio_prompt."""
+    if config is None:
+        config = LLMConfig.default_openai()
+    
+    client = _client_for(config)
+    return await client.agenerate(
+        _edit_messages(_AUDIO_PROMPT_EDITOR_MESSAGE, prompt, change_description),
+        semantic_text=change_description
+    )
+
+async def batch_create_prompts(tasks: List[str], config: Optional[LLMConfig] = None,
+                               max_concurrency: int = 10) -> List[str]:
+    """Create prompts for many tasks concurrently.
+    
+    Args:
+        tasks: Task descriptions or existing prompts to improve
+        config: Optional LLM configuration. If not provided, uses default OpenAI config
+        max_concurrency: Maximum number of requests in flight at once
+        
+    Returns:
+        List[str]: The generated prompts, in the same order as the tasks
+    """
+    if config is None:
+        config = LLMConfig.default_openai()
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _bounded(task: str) -> str:
+        async with semaphore:
+            return await acreate_prompt(task, config=config)
+    
+    # Hold the loop's connection pools open across the whole batch.
+    async with LLMClient.async_session():
+        return list(await asyncio.gather(*(_bounded(task) for task in tasks)))
+
+_BATCH_TERMINAL_STATES = {"completed", "failed", "expired", "cancelled"}
+
+def _batch_client(config: Optional[LLMConfig]) -> Any:
+    """Return the OpenAI SDK client used for Batch API calls."""
+    if config is None:
+        config = LLMConfig.default_openai()
+    if config.provider != LLMProvider.OPENAI:
+        raise ValueError(f"Batch API is not supported for provider: {config.provider}")
+    return _client_for(config).client
+
+def submit_batch(tasks: List[str], config: Optional[LLMConfig] = None) -> str:
+    """Submit prompt-creation tasks to the OpenAI Batch API.
+    
+    Batch requests are billed at a discount and are completed asynchronously
+    within 24 hours. Use poll_batch and fetch_batch_results to collect them.
+    
+    Args:
+        tasks: Task descriptions or existing prompts to improve
+        config: Optional LLM configuration. If not provided, uses default OpenAI config
+        
+    Returns:
+        str: The ID of the submitted batch
+    """
+    if config is None:
+        config = LLMConfig.default_openai()
+    client = _batch_client(config)
+    
+    lines = []
+    for i, task in enumerate(tasks):
+        body: Dict[str, Any] = {
+            "model": config.model,
+            "messages": _create_messages(_PROMPT_GENERATOR_MESSAGE, task),
+            "temperature": config.temperature,
+        }
+        if config.max_tokens is not None:
+            body["max_tokens"] = config.max_tokens
+        lines.append(json.dumps({
+            "custom_id": f"task-{i}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body,
+        }))
+    
+    batch_file = client.files.create(
+        file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    return cast(str, batch.id)
+
+def poll_batch(batch_id: str, config: Optional[LLMConfig] = None,
+               interval: float = 60.0, timeout: Optional[float] = None) -> str:
+    """Wait for a batch to finish.
+    
+    Args:
+        batch_id: The ID returned by submit_batch
+        config: Optional LLM configuration. If not provided, uses default OpenAI config
+        interval: Seconds to wait between status checks
+        timeout: Maximum seconds to wait, or None to wait indefinitely
+        
+    Returns:
+        str: The final batch status ("completed", "failed", "expired" or "cancelled")
+    """
+    client = _batch_client(config)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        status = client.batches.retrieve(batch_id).status
+        if status in _BATCH_TERMINAL_STATES:
+            return cast(str, status)
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(f"Batch {batch_id} still {status} after {timeout}s")
+        time.sleep(interval)
+
+def fetch_batch_results(batch_id: str, config: Optional[LLMConfig] = None) -> List[Optional[str]]:
+    """Fetch the generated prompts of a finished batch.
+    
+    Args:
+        batch_id: The ID returned by submit_batch
+        config: Optional LLM configuration. If not provided, uses default OpenAI config
+        
+    Returns:
+        List[Optional[str]]: The generated prompts in task order, with None for
+        tasks that failed
+    """
+    client = _batch_client(config)
+    batch = client.batches.retrieve(batch_id)
+    if batch.output_file_id is None:
+        raise ValueError(f"Batch {batch_id} has no output (status: {batch.status})")
+    
+    results: List[Optional[str]] = [None] * batch.request_counts.total
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        index = int(record["custom_id"].rsplit("-", 1)[1])
+        results[index] = response["body"]["choices"][0]["message"]["content"]
+    return results
 
 def generate_audio_prompt(task_or_prompt: str, model: str = "gpt-4o") -> str:
     """Simple interface for generating audio-optimized prompts using OpenAI.
@@ -235,12 +864,74 @@ def generate_prompt(task_or_prompt: str, model: str = "gpt-4o") -> str:
     )
     return create_prompt(task_or_prompt, config=config)
 
+# Models served by the legacy Completions endpoint, which accepts a list of
+# prompts in a single request.
+_COMPLETIONS_MODELS = ("gpt-3.5-turbo-instruct", "davinci-002", "babbage-002")
+
+def generate_prompts_batch(tasks: List[str], model: str = "gpt-3.5-turbo-instruct",
+                           max_tokens: int = 1024) -> List[str]:
+    """Generate prompts for many tasks in as few requests as possible.
+    
+    Completions-capable models (e.g. gpt-3.5-turbo-instruct) receive every
+    task in a single Completions request. Chat models do not accept prompt
+    lists, so they fall back to concurrent chat requests via
+    batch_create_prompts. That fallback runs its own event loop and cannot
+    be used from async code; await batch_create_prompts there instead.
+    
+    Args:
+        tasks: Task descriptions or existing prompts to improve
+        model: The OpenAI model to use (default: "gpt-3.5-turbo-instruct")
+        max_tokens: Maximum tokens to generate per prompt
+        
+    Returns:
+        List[str]: The generated prompts, in the same order as the tasks
+    """
+    config = LLMConfig(
+        provider=LLMProvider.OPENAI,
+        model=model,
+        api_key=os.getenv("OPENAI_API_KEY"),
+        max_tokens=max_tokens
+    )
+    if not model.startswith(_COMPLETIONS_MODELS):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(batch_create_prompts(tasks, config=config))
+        raise RuntimeError(
+            "generate_prompts_batch cannot run chat models inside a running event loop; "
+            "await batch_create_prompts instead"
+        )
+    if not tasks:
+        return []
+    
+    completion = _client_for(config).client.completions.create(
+        model=model,
+        prompt=[
+            f"{PROMPT_GENERATOR.content}\n\nTask, Goal, or Current Prompt:\n{task}\n\n"
+            for task in tasks
+        ],
+        temperature=config.temperature,
+        max_tokens=max_tokens
+    )
+    # Choices are not guaranteed to come back in prompt order.
+    choices = sorted(completion.choices, key=lambda choice: choice.index)
+    return [choice.text.strip() for choice in choices]
+
+# Chat models that reject response_format={"type": "json_object"}
+_NO_JSON_MODE_MODELS = frozenset({
+    "gpt-4", "gpt-4-0314", "gpt-4-0613",
+    "gpt-4-32k", "gpt-4-32k-0314", "gpt-4-32k-0613",
+    "gpt-3.5-turbo-0301", "gpt-3.5-turbo-0613",
+    "gpt-3.5-turbo-16k", "gpt-3.5-turbo-16k-0613",
+})
+
 def generate_schema(description: str, model: str = "gpt-4") -> Dict:
     """Generate a JSON schema based on a description.
     
     Args:
         description: Description of the function to generate a schema for
-        model: The model to use for generation
+        model: The model to use for generation. JSON mode is requested when
+            the model supports it.
         
     Returns:
         Dict containing the generated schema
@@ -250,22 +941,17 @@ def generate_schema(description: str, model: str = "gpt-4") -> Dict:
         {"role": "user", "content": description}
     ]
     
-    response = OpenAI.ChatCompletion.create(
-        model=model,
-        messages=messages,
-        temperature=0.0,
-        max_tokens=1000
-    )
-    
-    schema_str = response.choices[0].message.content
+    client = _get_client(LLMProvider.OPENAI, model, os.getenv("OPENAI_API_KEY"), None, 0.0, 1000)
+    kwargs: Dict[str, Any] = {}
+    if model not in _NO_JSON_MODE_MODELS:
+        kwargs["response_format"] = {"type": "json_object"}
+    schema_str = client.generate(messages, **kwargs)
     try:
-        # Extract the schema from the response if it's wrapped in a code block
+        # Without JSON mode the schema may be wrapped in a code block
         if "```json" in schema_str:
             schema_str = schema_str.split("```json")[1].split("```")[0].strip()
         elif "```" in schema_str:
             schema_str = schema_str.split("```")[1].split("```")[0].strip()
-            
-        schema = json.loads(schema_str)
-        return schema
+        return _json_loads(schema_str)
     except json.JSONDecodeError as e:
         raise ValueError(f"Failed to parse generated schema: {e}")
@@ -1,5 +1,8 @@
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field, fields
+from keyword import iskeyword
+from string import Formatter
+import textwrap
+from typing import Any, Callable, Collection, Dict, FrozenSet, List, Optional, Sequence, Tuple, cast
 from enum import Enum
 
 class PromptCategory(Enum):
@@ -11,18 +14,165 @@ class PromptCategory(Enum):
     GENERAL = "general"
     PHILOSOPHICAL = "philosophical"
 
-@dataclass
+OPENAI_MODELS: Tuple[str, ...] = ("gpt-4", "gpt-3.5-turbo")
+OLLAMA_MODELS: Tuple[str, ...] = (
+    "llama3.2", "llama3.1",
+    "mistral", "mixtral",
+    "codellama", "codellama:13b", "codellama:34b"
+)
+ALL_MODELS: Tuple[str, ...] = OPENAI_MODELS + OLLAMA_MODELS
+
+_CONVERSIONS: Dict[str, Callable[[Any], str]] = {"s": str, "r": repr, "a": ascii}
+
+# Anthropic accepts at most this many cache_control blocks per request
+_MAX_CACHE_BREAKPOINTS = 4
+
+# Parsed template: (literal_text, field_name, format_spec, conversion) tuples
+_Plan = List[Tuple[str, Optional[str], Optional[str], Optional[str]]]
+
+def _is_simple_field(name: str, spec: str) -> bool:
+    """Whether a replacement field is a plain keyword lookup."""
+    return (
+        bool(name) and not name.isdigit()
+        and "." not in name and "[" not in name and "{" not in spec
+    )
+
+def _compile_formatter(plan: _Plan) -> Optional[Callable[..., str]]:
+    """Generate a function rendering a parsed template as a single f-string.
+    
+    Returns None if a field cannot be expressed safely as an f-string
+    replacement, in which case the caller falls back to the parsed plan.
+    """
+    names: List[str] = []
+    pieces: List[str] = []
+    for literal, name, spec, conversion in plan:
+        if literal:
+            pieces.append("f" + repr(literal.replace("{", "{{").replace("}", "}}")))
+        if name is None:
+            continue
+        spec = spec or ""
+        if not name.isidentifier() or iskeyword(name) or any(c in spec for c in "'\"\\\n"):
+            return None
+        if name not in names:
+            names.append(name)
+        field_src = name + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "")
+        pieces.append("f'{" + field_src + "}'")
+    # Name the catch-all so it cannot collide with a template field.
+    rest = "_unused"
+    while rest in names:
+        rest += "_"
+    params = "".join(f"{name}, " for name in names)
+    if params:
+        params = "*, " + params
+    src = f"def _render({params}**{rest}):\n    return {' '.join(pieces) or repr('')}\n"
+    namespace: Dict[str, Any] = {}
+    exec(src, {"__builtins__": {}}, namespace)
+    return cast(Callable[..., str], namespace["_render"])
+
+@dataclass(frozen=True, slots=True)
 class Prompt:
-    """Represents a single prompt template with its metadata."""
+    """Represents a single prompt template with its metadata.
+    
+    Prompts are immutable; tags are stored as a frozenset and other list
+    arguments as tuples.
+    cache_breakpoints are character offsets in the formatted prompt after
+    which a provider prompt cache may store the prefix. They should fall
+    within the static text that precedes the first template field, must be
+    strictly increasing, and at most four are allowed.
+    """
     template: str
     category: PromptCategory
     name: str
     description: str
-    tags: List[str] = field(default_factory=list)
-    model_compatibility: List[str] = field(default_factory=list)
-    parameters: Dict[str, str] = field(default_factory=dict)
+    tags: Collection[str] = field(default_factory=frozenset)
+    model_compatibility: Sequence[str] = field(default_factory=tuple)
+    parameters: Dict[str, str] = field(default_factory=dict, hash=False)
     version: str = "1.0"
+    cache_breakpoints: Sequence[int] = ()
+    _chunks: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _slots: Tuple[Tuple[int, str, str, Optional[str]], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _simple: bool = field(init=False, repr=False, compare=False)
+    _render: Optional[Callable[..., str]] = field(init=False, repr=False, compare=False)
+    _required: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Drop source indentation and trailing whitespace; it is only token cost.
+        template = "\n".join(
+            line.rstrip() for line in textwrap.dedent(self.template).strip().splitlines()
+        )
+        object.__setattr__(self, "template", template)
+        object.__setattr__(self, "tags", frozenset(self.tags))
+        object.__setattr__(self, "model_compatibility", tuple(self.model_compatibility))
+        object.__setattr__(self, "cache_breakpoints", tuple(self.cache_breakpoints))
+        points = self.cache_breakpoints
+        if len(points) > _MAX_CACHE_BREAKPOINTS:
+            raise ValueError(f"At most {_MAX_CACHE_BREAKPOINTS} cache breakpoints are supported")
+        if any(point < 0 for point in points) or any(a >= b for a, b in zip(points, points[1:])):
+            raise ValueError("cache_breakpoints must be non-negative and strictly increasing")
+        # Parse the template once into literal chunks with empty slots for the
+        # fields; format() then fills a copy of the chunks and joins it.
+        plan = list(Formatter().parse(self.template))
+        simple = all(
+            name is None or _is_simple_field(name, spec or "")
+            for _, name, spec, _ in plan
+        )
+        chunks: List[str] = []
+        slots: List[Tuple[int, str, str, Optional[str]]] = []
+        for literal, name, spec, conversion in plan:
+            if literal:
+                chunks.append(literal)
+            if name is not None:
+                slots.append((len(chunks), name, spec or "", conversion))
+                chunks.append("")
+        object.__setattr__(self, "_chunks", tuple(chunks))
+        object.__setattr__(self, "_slots", tuple(slots))
+        object.__setattr__(self, "_simple", simple)
+        object.__setattr__(self, "_required", frozenset(
+            name.partition(".")[0].partition("[")[0]
+            for _, name, _, _ in plan
+            if name and not name.isdigit()
+        ))
+        # Specialize simple templates into a generated f-string function.
+        object.__setattr__(self, "_render", _compile_formatter(plan) if simple else None)
     
-    def format(self, **kwargs) -> str:
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The generated _render function cannot be pickled; rebuild it on load.
+        return (type(self), tuple(getattr(self, f.name) for f in fields(self) if f.init))
+
+    def format(self, **kwargs: Any) -> str:
         """Format the prompt template with the given parameters."""
-        return self.template.format(**kwargs)
+        missing = self._required.difference(kwargs)
+        if missing:
+            raise KeyError(", ".join(sorted(missing)))
+        if self._render is not None:
+            return self._render(**kwargs)
+        if not self._simple:
+            return self.template.format(**kwargs)
+        parts = list(self._chunks)
+        for index, name, spec, conversion in self._slots:
+            value = kwargs[name]
+            if conversion:
+                value = _CONVERSIONS[conversion](value)
+            parts[index] = format(value, spec)
+        return "".join(parts)
+
+    def to_anthropic_blocks(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        """Format the prompt as Anthropic text blocks with cache_control markers.
+        
+        Every block that ends at a cache breakpoint is marked ephemeral; the
+        remainder after the last breakpoint is left unmarked.
+        """
+        text = self.format(**kwargs)
+        end = len(text)
+        points = [0, *(min(point, end) for point in self.cache_breakpoints), end]
+        blocks: List[Dict[str, Any]] = []
+        for i, (start, end) in enumerate(zip(points, points[1:])):
+            if start >= end:
+                continue
+            block: Dict[str, Any] = {"type": "text", "text": text[start:end]}
+            if i < len(points) - 2:
+                block["cache_control"] = {"type": "ephemeral"}
+            blocks.append(block)
+        return blocks
@@ -1,7 +1,8 @@
 """
 Core module for managing prompts.
 """
-from typing import Dict, List, Optional
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Optional
 from .models import Prompt, PromptCategory
 
 class PromptManager:
@@ -10,10 +11,20 @@ class PromptManager:
     def __init__(self):
         """Initialize the PromptManager."""
         self.prompts: Dict[str, Prompt] = {}
+        self._by_tag: DefaultDict[str, List[Prompt]] = defaultdict(list)
+        self._by_cat: DefaultDict[PromptCategory, List[Prompt]] = defaultdict(list)
         
     def add_prompt(self, prompt: Prompt) -> None:
-        """Add a prompt to the manager."""
+        """Add a prompt to the manager, replacing any prompt with the same name."""
+        old = self.prompts.get(prompt.name)
+        if old is not None:
+            self._by_cat[old.category].remove(old)
+            for tag in old.tags:
+                self._by_tag[tag].remove(old)
         self.prompts[prompt.name] = prompt
+        self._by_cat[prompt.category].append(prompt)
+        for tag in prompt.tags:
+            self._by_tag[tag].append(prompt)
     
     def get_prompt(self, name: str) -> Optional[Prompt]:
         """Get a prompt by name."""
@@ -21,8 +32,8 @@ class PromptManager:
     
     def get_prompts_by_category(self, category: PromptCategory) -> List[Prompt]:
         """Get all prompts in a specific category."""
-        return [p for p in self.prompts.values() if p.category == category]
+        return list(self._by_cat.get(category, ()))
     
     def get_prompts_by_tag(self, tag: str) -> List[Prompt]:
         """Get all prompts with a specific tag."""
-        return [p for p in self.prompts.values() if tag in p.tags]
+        return list(self._by_tag.get(tag, ()))
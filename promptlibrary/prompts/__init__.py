@@ -1,11 +1,19 @@
 """
 Collection of pre-defined prompts organized by category.
+
+Prompt modules are imported lazily on first attribute access.
 """
 
-from .coding import CODE_REVIEW_PROMPT
-from .meta import META_PROMPT, generate_prompt
-from .philosophical import AI_ETHICS_EXPLORATION
-from .system import PROMPT_GENERATOR
+import importlib
+from typing import Any, List
+
+_ATTR_MODULES = {
+    'CODE_REVIEW_PROMPT': '.coding',
+    'META_PROMPT': '.meta',
+    'generate_prompt': '.meta',
+    'AI_ETHICS_EXPLORATION': '.philosophical',
+    'PROMPT_GENERATOR': '.system'
+}
 
 __all__ = [
     'CODE_REVIEW_PROMPT',
@@ -14,3 +22,14 @@ __all__ = [
     'AI_ETHICS_EXPLORATION',
     'PROMPT_GENERATOR'
 ]
+
+def __getattr__(name: str) -> Any:
+    module_name = _ATTR_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
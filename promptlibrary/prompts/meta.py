@@ -1,11 +1,7 @@
-from ..models import Prompt, PromptCategory
+from ..models import ALL_MODELS, Prompt, PromptCategory
 
-META_PROMPT = Prompt(
-    name="meta_prompt",
-    category=PromptCategory.SYSTEM,
-    description="A meta prompt for generating other prompts",
-    template="""Create a prompt that achieves the following objective:
-{objective}
+# Static instructions shared by every META_PROMPT request (cacheable prefix)
+_META_PROMPT_PREFIX = """Create a prompt that achieves the objective described below.
 
 The prompt should:
 1. Be clear and specific
@@ -13,24 +9,29 @@ The prompt should:
 3. Guide the model towards the desired output format
 4. Include any relevant examples if needed
 
+"""
+
+META_PROMPT = Prompt(
+    name="meta_prompt",
+    category=PromptCategory.SYSTEM,
+    description="A meta prompt for generating other prompts",
+    template=_META_PROMPT_PREFIX + """Objective:
+{objective}
+
 Additional requirements:
 {requirements}
 
 Target audience: {audience}
 Expected output format: {output_format}""",
     tags=["meta", "prompt-generation"],
-    model_compatibility=[
-        "gpt-4", "gpt-3.5-turbo",
-        "llama3.2", "llama3.1",
-        "mistral", "mixtral",
-        "codellama", "codellama:13b", "codellama:34b"
-    ],
+    model_compatibility=ALL_MODELS,
     parameters={
         "objective": "The main goal of the prompt to be generated",
         "requirements": "Any specific requirements or constraints",
         "audience": "The intended audience (e.g., 'LLM model', 'human reviewer')",
         "output_format": "Expected format of the response"
-    }
+    },
+    cache_breakpoints=(len(_META_PROMPT_PREFIX),)
 )
 
 def generate_prompt(
@@ -1,5 +1,22 @@
-from typing import Dict, List, Optional, Union, Any
+"""JSON schema helpers for function definitions.
+
+FUNCTION_META_SCHEMA is deeply read-only (mappings are MappingProxyType,
+arrays are tuples), so it can be shared without defensive copies. Use
+function_meta_schema() for a plain dict that json, copy and jsonschema accept.
+"""
+from typing import Callable, Dict, List, Mapping, Optional, Union, Any, cast
+import itertools
 import json
+from types import MappingProxyType
+
+try:
+    import orjson
+
+    def _dumps_compact(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    def _dumps_compact(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
 
 class SchemaProperty:
     """Represents a property in a JSON schema"""
@@ -28,32 +45,63 @@ class SchemaProperty:
         return result
 
 class Schema:
-    """Represents a JSON schema for a function"""
+    """Represents a JSON schema for a function
+
+    Serialized forms are cached. Assigning an attribute invalidates the cache;
+    after changing properties in place, call invalidate(). The dictionary
+    returned by to_dict() is shared and must not be modified.
+    """
+    name: str
+    description: str
+    properties: Dict[str, SchemaProperty]
+    required: List[str]
+
     def __init__(self, name: str, description: str, properties: Dict[str, SchemaProperty],
                  required: Optional[List[str]] = None):
-        self.name = name
-        self.description = description
-        self.properties = properties
-        self.required = required or list(properties.keys())
+        # Bypass __setattr__ so the caches are reset once, not per attribute.
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "description", description)
+        object.__setattr__(self, "properties", properties)
+        object.__setattr__(self, "required", required or list(properties.keys()))
+        self.invalidate()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Discard the cached dictionary and JSON representations"""
+        self._dict_cache: Optional[Dict] = None
+        self._json_cache: Dict[Optional[int], str] = {}
+        self._prop_names = tuple(self.properties)
+        self._prop_objs = tuple(self.properties.values())
 
     def to_dict(self) -> Dict:
         """Convert the schema to a dictionary representation"""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "parameters": {
-                "type": "object",
-                "required": self.required,
-                "properties": {
-                    name: prop.to_dict() 
-                    for name, prop in self.properties.items()
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "name": self.name,
+                "description": self.description,
+                "parameters": {
+                    "type": "object",
+                    "required": self.required,
+                    "properties": dict(zip(
+                        self._prop_names,
+                        [prop.to_dict() for prop in self._prop_objs]
+                    ))
                 }
             }
-        }
+        return self._dict_cache
 
-    def to_json(self, indent: int = 2) -> str:
-        """Convert the schema to a JSON string"""
-        return json.dumps(self.to_dict(), indent=indent)
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Convert the schema to a JSON string; indent=None gives compact output"""
+        if indent not in self._json_cache:
+            if indent is None:
+                self._json_cache[indent] = _dumps_compact(self.to_dict())
+            else:
+                self._json_cache[indent] = json.dumps(self.to_dict(), indent=indent)
+        return self._json_cache[indent]
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Schema':
@@ -61,18 +109,16 @@ class Schema:
         name = data["name"]
         description = data["description"]
         params = data["parameters"]
-        properties = {}
-        
-        for prop_name, prop_data in params["properties"].items():
-            prop_type = prop_data["type"]
-            prop_desc = prop_data.get("description", "")
-            prop_enum = prop_data.get("enum")
-            prop_items = prop_data.get("items")
-            prop_props = prop_data.get("properties")
-            
-            properties[prop_name] = SchemaProperty(
-                prop_type, prop_desc, prop_enum, prop_items, prop_props
+        properties = {
+            prop_name: SchemaProperty(
+                prop_data["type"],
+                prop_data.get("description", ""),
+                prop_data.get("enum"),
+                prop_data.get("items"),
+                prop_data.get("properties")
             )
+            for prop_name, prop_data in params["properties"].items()
+        }
         
         required = params.get("required", list(properties.keys()))
         return cls(name, description, properties, required)
@@ -114,3 +160,110 @@ FUNCTION_META_SCHEMA = {
         }
     }
 }
+
+def _freeze(obj: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+FUNCTION_META_SCHEMA = _freeze(FUNCTION_META_SCHEMA)
+
+def _thaw(obj: Any) -> Any:
+    """Recursively convert read-only mappings to dicts and tuples to lists"""
+    if isinstance(obj, Mapping):
+        return {key: _thaw(value) for key, value in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(value) for value in obj]
+    return obj
+
+def function_meta_schema() -> Dict:
+    """Return FUNCTION_META_SCHEMA as a fresh, mutable plain-data dict"""
+    return cast(Dict, _thaw(FUNCTION_META_SCHEMA))
+
+_TYPE_TESTS = {
+    "object": "isinstance({0}, dict)",
+    "array": "isinstance({0}, list)",
+    "string": "isinstance({0}, str)",
+    "boolean": "isinstance({0}, bool)",
+    "integer": "(isinstance({0}, int) and not isinstance({0}, bool))",
+    "number": "(isinstance({0}, (int, float)) and not isinstance({0}, bool))",
+    "null": "{0} is None",
+}
+
+def _emit_checks(node: Mapping[str, Any], var: str, path: str, depth: int,
+                 lines: List[str], constants: Dict[str, Any], names: Any) -> None:
+    """Append validation statements for one schema node to lines"""
+    pad = "    " * depth
+    types = node.get("type")
+    if isinstance(types, str):
+        types = (types,)
+    if types is not None:
+        unknown = [name for name in types if name not in _TYPE_TESTS]
+        if unknown:
+            raise ValueError(f"Unsupported schema type: {unknown[0]}")
+        test = " or ".join(_TYPE_TESTS[name].format(var) for name in types)
+        lines.append(f"{pad}if not ({test}):")
+        lines.append(f"{pad}    raise ValueError({path} + {': expected ' + ' or '.join(types)!r})")
+    if "enum" in node:
+        enum_name = f"_enum{len(constants)}"
+        constants[enum_name] = tuple(node["enum"])
+        lines.append(f"{pad}if {var} not in {enum_name}:")
+        lines.append(f"{pad}    raise ValueError({path} + {': must be one of ' + repr(list(node['enum']))!r})")
+
+    # A node typed as exactly object/array has already been type-checked, so
+    # its keyword checks need no isinstance guard.
+    guard_obj = tuple(types or ()) != ("object",)
+    inner = "    " * (depth + guard_obj)
+    body: List[str] = []
+    for key in node.get("required", ()):
+        body.append(f"{inner}if {key!r} not in {var}:")
+        body.append(f"{inner}    raise ValueError({path} + {': missing required property ' + repr(key)!r})")
+    for key, child_node in node.get("properties", {}).items():
+        child = f"v{next(names)}"
+        child_lines: List[str] = []
+        _emit_checks(child_node, child, f"{path} + {'.' + key!r}", depth + guard_obj + 1,
+                     child_lines, constants, names)
+        if child_lines:
+            body.append(f"{inner}if {key!r} in {var}:")
+            body.append(f"{inner}    {child} = {var}[{key!r}]")
+            body.extend(child_lines)
+    if body:
+        if guard_obj:
+            lines.append(f"{pad}if isinstance({var}, dict):")
+        lines.extend(body)
+
+    if "items" in node:
+        guard_arr = tuple(types or ()) != ("array",)
+        inner = "    " * (depth + guard_arr)
+        index, child = f"i{next(names)}", f"v{next(names)}"
+        item_lines: List[str] = []
+        _emit_checks(node["items"], child, f"{path} + '[' + str({index}) + ']'",
+                     depth + guard_arr + 1, item_lines, constants, names)
+        if item_lines:
+            if guard_arr:
+                lines.append(f"{pad}if isinstance({var}, list):")
+            lines.append(f"{inner}for {index}, {child} in enumerate({var}):")
+            lines.extend(item_lines)
+
+def compile_validator(meta: Mapping[str, Any]) -> Callable[[Any], None]:
+    """Compile a JSON schema into a function that raises ValueError for invalid instances
+
+    Supports the type, enum, required, properties and items keywords; other
+    keywords are ignored. The schema is walked once here rather than on
+    every call, as a general-purpose validator would.
+    """
+    lines = ["def _validate(v0):"]
+    constants: Dict[str, Any] = {}
+    _emit_checks(meta, "v0", "'$'", 1, lines, constants, itertools.count(1))
+    lines.append("    return None")
+    namespace: Dict[str, Any] = {"__builtins__": {
+        "isinstance": isinstance, "dict": dict, "list": list, "str": str, "bool": bool,
+        "int": int, "float": float, "enumerate": enumerate, "ValueError": ValueError,
+    }, **constants}
+    exec("\n".join(lines), namespace)
+    return cast(Callable[[Any], None], namespace["_validate"])
+
+VALIDATE_FUNCTION = compile_validator(FUNCTION_META_SCHEMA)
@@ -1,23 +1,56 @@
+import os
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
+
+def _long_desc():
+    return Path(__file__).with_name("README.md").read_text(encoding="utf-8")
+
+
+# Opt-in native build: PROMPTLIBRARY_USE_MYPYC=1 compiles the prompt
+# formatting hot path with mypyc. The default install stays pure Python.
+ext_modules = []
+if os.environ.get("PROMPTLIBRARY_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["--follow-imports=silent", "promptlibrary/models.py"])
+
 setup(
     name="promptlibrary",
     version="0.1.0",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
         "pytest>=7.0.0",
         "pytest-cov>=4.0.0",
         "openai>=1.0.0",
         "ollama>=0.1.0",
-        "jsonschema>=4.20.0",
+        "httpx>=0.23.0",
         "pydantic>=2.5.0",
         "typing-extensions>=4.8.0",
         "python-dotenv>=1.0.0"
     ],
+    extras_require={
+        "http2": [
+            "httpx[http2]>=0.23.0"
+        ],
+        "jsonschema": [
+            "jsonschema>=4.20.0"
+        ],
+        "speedups": [
+            "orjson>=3.9.0"
+        ],
+        "semantic": [
+            "numpy>=1.24.0",
+            "sentence-transformers>=2.2.0",
+            "faiss-cpu>=1.7.4"
+        ]
+    },
     author="Jacques Murray",
     author_email="jacquesmmurray@gmail.com",
     description="A library for managing and organizing prompts",
-    long_description=open("README.md").read(),
+    long_description=_long_desc(),
     long_description_content_type="text/markdown",
     url="https://github.com/Jacques-Murray/promptlibrary",
     classifiers=[
@@ -0,0 +1,121 @@
+"""
+Tests for the LLM response caches.
+"""
+
+import pytest
+from promptlibrary.cache import LLMCache
+
+MESSAGES = [
+    {"role": "system", "content": "You are helpful."},
+    {"role": "user", "content": "Say hello."}
+]
+
+def test_make_key_is_stable():
+    """Test that identical requests produce identical keys."""
+    first = LLMCache.make_key("gpt-4o", MESSAGES, 0.0)
+    second = LLMCache.make_key("gpt-4o", [dict(m) for m in MESSAGES], 0.0)
+    
+    assert first == second
+    assert first != LLMCache.make_key("gpt-4o", MESSAGES, 0.5)
+    assert first != LLMCache.make_key("gpt-4o-mini", MESSAGES, 0.0)
+
+def test_cache_hit_and_miss_stats():
+    """Test that lookups update the hit and miss counters."""
+    cache = LLMCache()
+    key = LLMCache.make_key("gpt-4o", MESSAGES, 0.0)
+    
+    assert cache.get(key) is None
+    cache.set(key, "Hello!")
+    assert cache.get(key) == "Hello!"
+    assert cache.stats == {"hits": 1, "misses": 1, "size": 1}
+
+def test_cache_evicts_least_recently_used():
+    """Test LRU eviction once the cache is full."""
+    cache = LLMCache(max_size=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+    
+    assert len(cache) == 2
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+
+def _keyword_embedder(text):
+    """Embed text as counts of a few keywords, for deterministic tests."""
+    np = pytest.importorskip("numpy")
+    words = text.lower().split()
+    return np.array([
+        sum(w.startswith("dog") for w in words),
+        sum(w.startswith("poem") for w in words),
+        sum(w.startswith("cat") for w in words)
+    ], dtype=float)
+
+def test_semantic_cache_matches_similar_requests():
+    """Test that near-duplicate requests hit the semantic cache."""
+    pytest.importorskip("numpy")
+    from promptlibrary.cache import SemanticCache
+    
+    cache = SemanticCache(embedder=_keyword_embedder)
+    cache.set("gpt-4o", "Write a poem about dogs", "Woof.")
+    
+    assert cache.get("gpt-4o", "Compose a dog poem") == "Woof."
+    assert cache.get("gpt-4o", "Write a poem about cats") is None
+    assert cache.get("gpt-4o-mini", "Compose a dog poem") is None
+    assert cache.stats == {"hits": 1, "misses": 2, "size": 1}
+
+def test_semantic_cache_grows_past_initial_capacity():
+    """Test that stored embeddings survive resizing the partition."""
+    np = pytest.importorskip("numpy")
+    from promptlibrary.cache import SemanticCache
+    
+    def one_hot(text):
+        vector = np.zeros(64)
+        vector[int(text)] = 1.0
+        return vector
+    
+    cache = SemanticCache(embedder=one_hot)
+    for i in range(40):
+        cache.set("ns", str(i), f"response {i}")
+    
+    assert len(cache) == 40
+    assert cache.get("ns", "3") == "response 3"
+    assert cache.get("ns", "39") == "response 39"
+
+def test_semantic_cache_imports_faiss_once(monkeypatch):
+    """Test that a missing faiss is remembered instead of re-imported on every set."""
+    import builtins
+    np = pytest.importorskip("numpy")
+    from promptlibrary.cache import SemanticCache, _load_faiss
+    
+    attempts = []
+    real_import = builtins.__import__
+    
+    def fake_import(name, *args, **kwargs):
+        if name == "faiss":
+            attempts.append(name)
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+    
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+    _load_faiss.cache_clear()
+    cache = SemanticCache(embedder=lambda text: np.ones(4), faiss_threshold=2)
+    for i in range(6):
+        cache.set("ns", str(i), "response")
+    _load_faiss.cache_clear()
+    
+    assert attempts == ["faiss"]
+
+def test_semantic_cache_skips_texts_longer_than_max_chars():
+    """Test that texts the embedder would truncate are neither stored nor matched."""
+    pytest.importorskip("numpy")
+    from promptlibrary.cache import SemanticCache
+    
+    cache = SemanticCache(embedder=_keyword_embedder, max_chars=30)
+    cache.set("ns", "dog poem " + "x" * 30, "Long.")
+    cache.set("ns", "dog poem", "Short.")
+    
+    assert len(cache) == 1
+    assert cache.get("ns", "dog poem " + "y" * 30) is None
+    assert cache.get("ns", "a dog poem") == "Short."
@@ -0,0 +1,475 @@
+"""
+Tests for the LLM client helpers.
+"""
+
+import pytest
+from promptlibrary.llm import LLMClient, LLMConfig, LLMProvider
+
+@pytest.fixture
+def openai_config():
+    return LLMConfig(
+        provider=LLMProvider.OPENAI,
+        model="gpt-4o",
+        api_key="test-key"
+    )
+
+def test_openai_clients_share_connection_pool(openai_config):
+    """Test that OpenAI clients reuse the same HTTP connection pool."""
+    first = LLMClient(openai_config)
+    second = LLMClient(openai_config)
+    
+    assert first.client is not second.client
+    assert first.client._client is second.client._client
+
+def test_ollama_clients_shared_per_host():
+    """Test that Ollama clients are shared for the same host."""
+    first = LLMClient(LLMConfig.default_ollama())
+    second = LLMClient(LLMConfig.default_ollama())
+    
+    assert first.client is second.client
+
+def test_client_for_memoizes_equal_configs(openai_config):
+    """Test that equal configurations reuse the same LLMClient."""
+    from promptlibrary.llm import _client_for
+    
+    same_config = LLMConfig(
+        provider=LLMProvider.OPENAI,
+        model="gpt-4o",
+        api_key="test-key"
+    )
+    assert _client_for(openai_config) is _client_for(same_config)
+    
+    other_config = LLMConfig(
+        provider=LLMProvider.OPENAI,
+        model="gpt-4o-mini",
+        api_key="test-key"
+    )
+    assert _client_for(openai_config) is not _client_for(other_config)
+
+def test_deterministic_requests_are_cached(monkeypatch):
+    """Test that temperature-0 requests are served from the response cache."""
+    calls = []
+    
+    def fake_stream(self, messages, **kwargs):
+        calls.append(messages)
+        yield "cached "
+        yield "response"
+    
+    monkeypatch.setattr(LLMClient, "_stream", fake_stream)
+    LLMClient._response_cache.clear()
+    client = LLMClient(LLMConfig(
+        provider=LLMProvider.OPENAI,
+        model="gpt-4o",
+        api_key="test-key",
+        temperature=0.0
+    ))
+    messages = [{"role": "user", "content": "Say hello."}]
+    
+    assert client.generate(messages) == "cached response"
+    assert client.generate(messages) == "cached response"
+    assert len(calls) == 1
+    assert LLMClient.cache_stats()["hits"] == 1
+
+def test_non_deterministic_requests_are_not_cached(monkeypatch, openai_config):
+    """Test that sampled requests always reach the provider."""
+    calls = []
+    def fake_stream(self, messages, **kwargs):
+        calls.append(messages)
+        yield "x"
+    
+    monkeypatch.setattr(LLMClient, "_stream", fake_stream)
+    client = LLMClient(openai_config)
+    messages = [{"role": "user", "content": "Say hello."}]
+    
+    client.generate(messages)
+    client.generate(messages)
+    assert len(calls) == 2
+
+def test_batch_create_prompts_bounds_concurrency(monkeypatch, openai_config):
+    """Test that batch_create_prompts keeps order and limits requests in flight."""
+    import asyncio
+    from promptlibrary.llm import batch_create_prompts
+    
+    in_flight = []
+    peak = []
+    
+    async def fake_acomplete(self, messages, **kwargs):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return messages[-1]["content"].upper()
+    
+    monkeypatch.setattr(LLMClient, "_acomplete", fake_acomplete)
+    tasks = [f"task {i}" for i in range(6)]
+    results = asyncio.run(batch_create_prompts(tasks, openai_config, max_concurrency=2))
+    
+    assert results == [f"TASK, GOAL, OR CURRENT PROMPT:\nTASK {i}" for i in range(6)]
+    assert max(peak) == 2
+
+def test_async_clients_are_bound_to_event_loop(openai_config):
+    """Test that async clients are reused within a loop but not across loops."""
+    import asyncio
+    
+    client = LLMClient(openai_config)
+    
+    async def get_clients():
+        async with LLMClient.async_session():
+            return client._get_async_client(), client._get_async_client()
+    
+    first, second = asyncio.run(get_clients())
+    third, _ = asyncio.run(get_clients())
+    
+    assert first is second
+    assert first is not third
+
+def test_async_pools_are_closed_after_batch(monkeypatch, openai_config):
+    """Test that a batch run closes and releases its loop's connection pools."""
+    import asyncio
+    from promptlibrary.llm import batch_create_prompts
+    
+    pools = []
+    
+    async def fake_acomplete(self, messages, **kwargs):
+        self._get_async_client()
+        pools.append(LLMClient._get_async_http_client())
+        return "ok"
+    
+    monkeypatch.setattr(LLMClient, "_acomplete", fake_acomplete)
+    for _ in range(3):
+        asyncio.run(batch_create_prompts(["a", "b"], openai_config))
+    
+    assert len(set(map(id, pools))) == 3
+    assert all(pool.is_closed for pool in pools)
+    assert not LLMClient._async_loop_clients
+    assert not LLMClient._async_users
+
+class _FakeBatchSDK:
+    """Minimal stand-in for the OpenAI files and batches APIs."""
+    
+    def __init__(self):
+        from types import SimpleNamespace
+        self.uploaded = None
+        self.files = SimpleNamespace(create=self._create_file, content=self._content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve)
+    
+    def _create_file(self, file, purpose):
+        from types import SimpleNamespace
+        self.uploaded = file[1].decode("utf-8")
+        return SimpleNamespace(id="file-in")
+    
+    def _create_batch(self, input_file_id, endpoint, completion_window):
+        from types import SimpleNamespace
+        return SimpleNamespace(id="batch-1")
+    
+    def _retrieve(self, batch_id):
+        from types import SimpleNamespace
+        return SimpleNamespace(
+            status="completed",
+            output_file_id="file-out",
+            request_counts=SimpleNamespace(total=2)
+        )
+    
+    def _content(self, file_id):
+        import json
+        from types import SimpleNamespace
+        lines = [
+            {"custom_id": "task-1", "response": {"status_code": 200, "body": {
+                "choices": [{"message": {"content": "second"}}]}}},
+            {"custom_id": "task-0", "response": {"status_code": 500, "body": {}}},
+        ]
+        return SimpleNamespace(text="\n".join(json.dumps(line) for line in lines))
+
+def test_batch_submit_and_fetch(monkeypatch, openai_config):
+    """Test the Batch API request file and result ordering."""
+    import json
+    from promptlibrary import llm
+    
+    sdk = _FakeBatchSDK()
+    monkeypatch.setattr(llm, "_batch_client", lambda config: sdk)
+    
+    batch_id = llm.submit_batch(["first", "second"], openai_config)
+    requests = [json.loads(line) for line in sdk.uploaded.splitlines()]
+    
+    assert batch_id == "batch-1"
+    assert [r["custom_id"] for r in requests] == ["task-0", "task-1"]
+    assert requests[1]["body"]["model"] == "gpt-4o"
+    assert llm.poll_batch(batch_id, openai_config) == "completed"
+    assert llm.fetch_batch_results(batch_id, openai_config) == [None, "second"]
+
+def _mock_openai(handler):
+    """Build an OpenAI client whose requests are answered by a handler."""
+    import httpx
+    from openai import OpenAI
+    
+    return OpenAI(
+        api_key="test-key",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+def _chat_completion_stream(*pieces):
+    """Build a server-sent event response streaming the given pieces."""
+    import httpx
+    import json
+    
+    events = []
+    for piece in pieces:
+        chunk = {
+            "id": "chatcmpl-1",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]
+        }
+        events.append(f"data: {json.dumps(chunk)}\n\n")
+    events.append("data: [DONE]\n\n")
+    return httpx.Response(
+        200,
+        headers={"content-type": "text/event-stream"},
+        content="".join(events).encode("utf-8")
+    )
+
+def test_openai_requests_share_prompt_cache_key(openai_config):
+    """Test that requests with the same system prompt get the same prompt_cache_key."""
+    import json
+    
+    bodies = []
+    
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return _chat_completion_stream("o", "k")
+    
+    client = LLMClient(openai_config)
+    client.client = _mock_openai(handler)
+    system = {"role": "system", "content": "You write prompts."}
+    
+    assert client.generate([system, {"role": "user", "content": "one"}]) == "ok"
+    assert client.generate([system, {"role": "user", "content": "two"}]) == "ok"
+    assert bodies[0]["prompt_cache_key"] == bodies[1]["prompt_cache_key"]
+
+def test_generate_stream_yields_pieces(openai_config):
+    """Test that generate_stream yields the response as it arrives."""
+    client = LLMClient(openai_config)
+    client.client = _mock_openai(lambda request: _chat_completion_stream("Hel", "lo", "!"))
+    messages = [{"role": "user", "content": "Say hello."}]
+    
+    assert list(client.generate_stream(messages)) == ["Hel", "lo", "!"]
+    assert client.generate(messages) == "Hello!"
+
+def test_generate_schema_requests_json_output(monkeypatch):
+    """Test that generate_schema asks for JSON output and parses it."""
+    from promptlibrary.llm import generate_schema
+    
+    requests = []
+    
+    def fake_stream(self, messages, **kwargs):
+        requests.append(kwargs)
+        yield '{"name": "create_user", '
+        yield '"description": "Create a user"}'
+    
+    monkeypatch.setattr(LLMClient, "_stream", fake_stream)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    LLMClient._response_cache.clear()
+    schema = generate_schema("Create a user", model="gpt-4o")
+    
+    assert schema == {"name": "create_user", "description": "Create a user"}
+    assert requests[0]["response_format"] == {"type": "json_object"}
+
+def test_generate_schema_without_json_mode_strips_code_fence(monkeypatch):
+    """Test that models without JSON mode get no response_format and fences are removed."""
+    from promptlibrary.llm import generate_schema
+    
+    requests = []
+    
+    def fake_stream(self, messages, **kwargs):
+        requests.append(kwargs)
+        yield 'Here it is:\n```json\n{"name": "create_user"}\n```'
+    
+    monkeypatch.setattr(LLMClient, "_stream", fake_stream)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    LLMClient._response_cache.clear()
+    
+    assert generate_schema("Create a user") == {"name": "create_user"}
+    assert "response_format" not in requests[0]
+
+def test_create_prompt_skips_llm_for_short_tasks(monkeypatch):
+    """Test that short tasks below the threshold use the local template."""
+    from promptlibrary.llm import create_prompt
+    
+    def fail_stream(self, messages, **kwargs):
+        raise AssertionError("LLM should not be called")
+    
+    monkeypatch.setattr(LLMClient, "_stream", fail_stream)
+    prompt = create_prompt("write a haiku about rain", skip_llm_below_tokens=32)
+    
+    assert prompt.startswith("Write a haiku about rain.\n")
+    assert "# Output Format" in prompt
+
+def test_short_task_check_survives_tiktoken_download_failure(monkeypatch):
+    """Test that token counting falls back to words when tiktoken cannot load."""
+    import sys
+    import types
+    from promptlibrary import llm
+    
+    def get_encoding(name):
+        raise OSError("network unreachable")
+    
+    def fail_stream(self, messages, **kwargs):
+        raise AssertionError("LLM should not be called")
+    
+    monkeypatch.setitem(sys.modules, "tiktoken", types.SimpleNamespace(get_encoding=get_encoding))
+    monkeypatch.setattr(LLMClient, "_stream", fail_stream)
+    llm._token_encoder.cache_clear()
+    try:
+        prompt = llm.create_prompt("write a haiku about rain", skip_llm_below_tokens=32)
+    finally:
+        llm._token_encoder.cache_clear()
+    
+    assert prompt.startswith("Write a haiku about rain.\n")
+
+def test_llm_config_is_frozen_and_hashable(openai_config):
+    """Test that LLMConfig can be used as a cache key but not mutated."""
+    import dataclasses
+    
+    assert hash(openai_config) == hash(dataclasses.replace(openai_config))
+    assert not hasattr(openai_config, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        openai_config.model = "gpt-4o-mini"
+
+def test_generate_prompts_batch_orders_choices(monkeypatch):
+    """Test that completions choices are returned in task order."""
+    import httpx
+    import json
+    from promptlibrary import llm
+    
+    bodies = []
+    
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={
+            "id": "cmpl-1",
+            "object": "text_completion",
+            "created": 0,
+            "model": "gpt-3.5-turbo-instruct",
+            "choices": [
+                {"index": 1, "text": " second", "finish_reason": "stop", "logprobs": None},
+                {"index": 0, "text": " first", "finish_reason": "stop", "logprobs": None}
+            ]
+        })
+    
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    client = llm._client_for(LLMConfig(
+        provider=LLMProvider.OPENAI,
+        model="gpt-3.5-turbo-instruct",
+        api_key="test-key",
+        max_tokens=1024
+    ))
+    monkeypatch.setattr(client, "client", _mock_openai(handler))
+    
+    assert llm.generate_prompts_batch(["a", "b"]) == ["first", "second"]
+    assert len(bodies) == 1
+    assert len(bodies[0]["prompt"]) == 2
+
+def test_generate_prompts_batch_rejects_running_loop(monkeypatch):
+    """Test that the chat-model fallback explains how to batch from async code."""
+    import asyncio
+    from promptlibrary.llm import generate_prompts_batch
+    
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    
+    async def call_from_loop():
+        return generate_prompts_batch(["a"], model="gpt-4o")
+    
+    with pytest.raises(RuntimeError, match="await batch_create_prompts"):
+        asyncio.run(call_from_loop())
+
+def test_timeout_and_retries_reach_provider_clients(openai_config):
+    """Test that timeout and retry settings are applied to the SDK clients."""
+    import dataclasses
+    
+    config = dataclasses.replace(openai_config, timeout=5.0, max_retries=2)
+    client = LLMClient(config)
+    
+    assert client.client.timeout == 5.0
+    assert client.client.max_retries == 2
+    
+    ollama_config = dataclasses.replace(LLMConfig.default_ollama(), timeout=5.0)
+    assert LLMClient(ollama_config).client is not LLMClient(LLMConfig.default_ollama()).client
+
+def test_package_all_matches_exports():
+    """Test that every name in promptlibrary.__all__ is importable."""
+    import promptlibrary
+    
+    assert all(hasattr(promptlibrary, name) for name in promptlibrary.__all__)
+    assert {"LLMClient", "LLMConfig", "create_prompt", "edit_prompt"} <= set(promptlibrary.__all__)
+
+def test_semantic_cache_embeds_each_request_once(monkeypatch):
+    """Test that a semantic-cache miss reuses the lookup embedding when storing."""
+    np = pytest.importorskip("numpy")
+    from promptlibrary.cache import SemanticCache
+    
+    embedded = []
+    
+    def embedder(text):
+        embedded.append(text)
+        return np.array([1.0, 0.0]) if text == "first" else np.array([0.0, 1.0])
+    
+    monkeypatch.setattr(LLMClient, "_semantic_cache", SemanticCache(embedder=embedder))
+    monkeypatch.setattr(LLMClient, "_stream", lambda self, messages, **kwargs: iter(["ok"]))
+    client = LLMClient(LLMConfig(
+        provider=LLMProvider.OPENAI, model="gpt-4o", api_key="test-key", semantic_cache=True
+    ))
+    client.generate([{"role": "user", "content": "first"}])
+    client.generate([{"role": "user", "content": "second"}])
+    
+    assert embedded == ["first", "second"]
+
+def test_semantic_cache_keys_edits_on_change_description(monkeypatch):
+    """Test that different edits of one prompt are not served from each other."""
+    np = pytest.importorskip("numpy")
+    from promptlibrary.cache import SemanticCache
+    from promptlibrary.llm import edit_prompt
+    
+    prefixes = {}
+    
+    def truncating_embedder(text):
+        # Like a real model, only the start of the text is seen.
+        vector = np.zeros(16)
+        vector[prefixes.setdefault(text[:40], len(prefixes))] = 1.0
+        return vector
+    
+    responses = iter(["shorter", "formal", "other prompt"])
+    monkeypatch.setattr(LLMClient, "_semantic_cache", SemanticCache(embedder=truncating_embedder))
+    monkeypatch.setattr(LLMClient, "_stream", lambda self, messages, **kwargs: iter([next(responses)]))
+    config = LLMConfig(provider=LLMProvider.OPENAI, model="gpt-4o", api_key="test-key",
+                       semantic_cache=True)
+    prompt = "You are a helpful assistant. " * 20
+    
+    assert edit_prompt(prompt, "make it shorter", config) == "shorter"
+    assert edit_prompt(prompt, "make it formal", config) == "formal"
+    assert edit_prompt(prompt + "!", "make it shorter", config) == "other prompt"
+    assert edit_prompt(prompt, "make it shorter", config) == "shorter"
+
+def test_async_session_reuses_pool_for_sequential_calls(monkeypatch, openai_config):
+    """Test that sequential awaits inside one session share a single pool."""
+    import asyncio
+    from promptlibrary.llm import acreate_prompt
+    
+    pools = []
+    
+    async def fake_acomplete(self, messages, **kwargs):
+        pools.append(LLMClient._get_async_http_client())
+        return "ok"
+    
+    async def run():
+        async with LLMClient.async_session():
+            for task in ("a", "b", "c"):
+                await acreate_prompt(task, openai_config)
+            return pools[0].is_closed
+    
+    monkeypatch.setattr(LLMClient, "_acomplete", fake_acomplete)
+    LLMClient._response_cache.clear()
+    
+    assert asyncio.run(run()) is False
+    assert len(set(map(id, pools))) == 1
+    assert pools[0].is_closed
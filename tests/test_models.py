@@ -0,0 +1,137 @@
+"""
+Tests for the Prompt model.
+"""
+
+import pytest
+from promptlibrary.models import Prompt, PromptCategory
+
+def make_prompt(template):
+    return Prompt(
+        name="test_prompt",
+        category=PromptCategory.GENERAL,
+        description="A test prompt",
+        template=template
+    )
+
+@pytest.mark.parametrize("template, kwargs", [
+    ("Hello {name}!", {"name": "World"}),
+    ("{a}{b} and {a}", {"a": 1, "b": 2}),
+    ("Braces {{literal}} around {value}", {"value": "x"}),
+    ("Padded [{value:>6}] {ratio:.2f} {value!r}", {"value": "abc", "ratio": 0.5}),
+    ("No fields at all", {}),
+    ("{item.real} and {items[0]}", {"item": 3, "items": ["first"]}),
+    ("Extra arguments are ignored: {used}", {"used": "yes", "unused": "no"}),
+    ("Quote fill [{value:'<6}] and keyword {class}", {"value": "ab", "class": "c"}),
+    ("Quotes ' \" and backslashes \\ in {value}", {"value": "text"}),
+    ("Non-identifier key {user-name:>6} then {{x}}", {"user-name": "ab"}),
+    ("Fields named like the catch-all: {_unused} {_unused_}", {"_unused": 1, "_unused_": 2}),
+])
+def test_format_matches_str_format(template, kwargs):
+    """Test that Prompt.format behaves exactly like str.format."""
+    assert make_prompt(template).format(**kwargs) == template.format(**kwargs)
+
+def test_format_missing_parameter_raises_key_error():
+    """Test that a missing parameter raises KeyError like str.format."""
+    with pytest.raises(KeyError):
+        make_prompt("Hello {name}!").format()
+
+def test_format_reports_all_missing_parameters():
+    """Test that every missing parameter is named before formatting starts."""
+    prompt = make_prompt("{greeting}, {name}! {item.real} {items[0]}")
+    
+    with pytest.raises(KeyError, match="greeting, item, items"):
+        prompt.format(name="World")
+
+def test_simple_templates_are_specialized():
+    """Test that keyword-only templates get a generated render function."""
+    assert make_prompt("Hello {name}!")._render is not None
+    assert make_prompt("Hello {0}!")._render is None
+
+def test_prompt_pickles_with_generated_renderer():
+    """Test that prompts survive pickling and rebuild their render function."""
+    import pickle
+    from promptlibrary.prompts.meta import META_PROMPT
+    
+    restored = pickle.loads(pickle.dumps(META_PROMPT))
+    
+    assert restored == META_PROMPT
+    assert restored._render is not None
+    kwargs = {"objective": "o", "requirements": "r", "audience": "a", "output_format": "f"}
+    assert restored.format(**kwargs) == META_PROMPT.format(**kwargs)
+
+def test_format_reraises_unrelated_type_errors():
+    """Test that type errors from format specs are not reported as missing keys."""
+    with pytest.raises(TypeError):
+        make_prompt("{value:>5}").format(value=[1, 2])
+
+def test_prompt_is_frozen_and_hashable():
+    """Test that prompts are immutable, hashable and store immutable collections."""
+    import dataclasses
+    
+    prompt = Prompt(
+        name="test_prompt",
+        category=PromptCategory.GENERAL,
+        description="A test prompt",
+        template="Hello {name}!",
+        tags=["greeting"],
+        parameters={"name": "Who to greet"}
+    )
+    
+    assert prompt.tags == frozenset({"greeting"})
+    assert not hasattr(prompt, "__dict__")
+    assert hash(prompt) == hash(dataclasses.replace(prompt))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        prompt.template = "Goodbye {name}!"
+
+def test_template_whitespace_is_normalized():
+    """Test that indentation and trailing whitespace are removed from templates."""
+    prompt = make_prompt("""
+        Review this code:   
+            {code}
+        
+        Thanks.  
+    """)
+    
+    assert prompt.template == "Review this code:\n    {code}\n\nThanks."
+    assert prompt.format(code="x = 1") == "Review this code:\n    x = 1\n\nThanks."
+
+def test_to_anthropic_blocks_marks_cached_prefix():
+    """Test that text before each breakpoint becomes a cache-marked block."""
+    from promptlibrary.prompts import META_PROMPT
+    
+    kwargs = dict(objective="o", requirements="r", audience="a", output_format="f")
+    blocks = META_PROMPT.to_anthropic_blocks(**kwargs)
+    
+    assert "".join(block["text"] for block in blocks) == META_PROMPT.format(**kwargs)
+    assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+    assert "{" not in blocks[0]["text"] and "Objective" not in blocks[0]["text"]
+    assert "cache_control" not in blocks[-1]
+    assert make_prompt("No breakpoints").to_anthropic_blocks() == [
+        {"type": "text", "text": "No breakpoints"}
+    ]
+
+@pytest.mark.parametrize("breakpoints", [(8, 3), (3, 3), (-1,), (1, 2, 3, 4, 5)])
+def test_invalid_cache_breakpoints_are_rejected(breakpoints):
+    """Test that unsorted, negative or too many breakpoints raise ValueError."""
+    with pytest.raises(ValueError):
+        Prompt(
+            name="test_prompt",
+            category=PromptCategory.GENERAL,
+            description="A test prompt",
+            template="ABCDEFGHIJ {x}",
+            cache_breakpoints=breakpoints
+        )
+
+def test_cache_breakpoints_past_the_end_are_clamped():
+    """Test that blocks never overlap when a breakpoint exceeds the formatted text."""
+    prompt = Prompt(
+        name="test_prompt",
+        category=PromptCategory.GENERAL,
+        description="A test prompt",
+        template="ABCDEFGHIJ {x}",
+        cache_breakpoints=(3, 100)
+    )
+    blocks = prompt.to_anthropic_blocks(x=1)
+    
+    assert [block["text"] for block in blocks] == ["ABC", "DEFGHIJ 1"]
+    assert all("cache_control" in block for block in blocks)
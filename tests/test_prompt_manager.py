@@ -55,3 +55,18 @@ def test_get_prompts_by_tag(sample_prompt):
     
     nonexistent_prompts = manager.get_prompts_by_tag("nonexistent")
     assert len(nonexistent_prompts) == 0
+
+def test_replacing_prompt_updates_indexes(sample_prompt):
+    """Test that re-adding a prompt by name drops it from its old tags and category."""
+    import dataclasses
+    
+    manager = PromptManager()
+    manager.add_prompt(sample_prompt)
+    manager.add_prompt(dataclasses.replace(
+        sample_prompt, tags=["updated"], category=PromptCategory.WRITING
+    ))
+    
+    assert manager.get_prompts_by_tag("test") == []
+    assert manager.get_prompts_by_category(PromptCategory.CODING) == []
+    assert len(manager.get_prompts_by_category(PromptCategory.WRITING)) == 1
+    assert [p.tags for p in manager.get_prompts_by_tag("updated")] == [frozenset({"updated"})]
@@ -1,5 +1,8 @@
 import pytest
-from promptlibrary.schema import Schema, SchemaProperty, FUNCTION_META_SCHEMA
+from promptlibrary.schema import (
+    Schema, SchemaProperty, FUNCTION_META_SCHEMA, VALIDATE_FUNCTION, compile_validator,
+    function_meta_schema
+)
 import json
 
 def test_schema_property_basic():
@@ -44,6 +47,15 @@ def test_schema_property_with_items():
     assert prop_dict["type"] == "array"
     assert prop_dict["items"] == item_schema
 
+def test_schema_property_reflects_later_assignments():
+    """Test that to_dict follows optional keywords assigned after construction"""
+    prop = SchemaProperty(type_="string", description="A test property")
+    prop.enum = ["a"]
+    assert prop.to_dict()["enum"] == ["a"]
+    
+    prop.enum = None
+    assert "enum" not in prop.to_dict()
+
 def test_schema_basic():
     """Test basic Schema creation and serialization"""
     schema = Schema(
@@ -140,3 +152,125 @@ def test_meta_schema_validity():
     assert params["type"] == "object"
     assert "required" in params
     assert "properties" in params["properties"]
+
+def test_schema_serialization_is_cached_and_invalidated():
+    """Test that serialized forms are cached until the schema changes"""
+    schema = Schema(
+        name="test_function",
+        description="A test function schema",
+        properties={
+            "param1": SchemaProperty(type_="string", description="First parameter")
+        }
+    )
+    assert schema.to_dict() is schema.to_dict()
+    assert schema.to_json() is schema.to_json()
+    
+    schema.description = "An updated description"
+    assert schema.to_dict()["description"] == "An updated description"
+    assert json.loads(schema.to_json())["description"] == "An updated description"
+    
+    schema.properties["param2"] = SchemaProperty(type_="number", description="Second")
+    schema.invalidate()
+    assert "param2" in schema.to_dict()["parameters"]["properties"]
+
+    schema.properties = {"other": SchemaProperty(type_="boolean", description="Other")}
+    assert list(schema.to_dict()["parameters"]["properties"]) == ["other"]
+
+def test_schema_from_dict_round_trip():
+    """Test that from_dict restores properties equivalent to the originals"""
+    schema = Schema(
+        name="test_function",
+        description="A test function schema",
+        properties={
+            "mode": SchemaProperty(type_="string", description="Mode", enum=["a", "b"]),
+            "tags": SchemaProperty(type_="array", description="Tags", items={"type": "string"})
+        },
+        required=["mode"]
+    )
+    restored = Schema.from_dict(schema.to_dict())
+    
+    assert restored.to_dict() == schema.to_dict()
+    assert restored.properties["mode"].enum == ["a", "b"]
+    assert restored.properties["tags"].properties is None
+
+def test_schema_to_json_compact():
+    """Test that indent=None produces compact JSON"""
+    schema = Schema(
+        name="test_function",
+        description="Beschreibung mit Umlauten: äöü",
+        properties={
+            "param1": SchemaProperty(type_="string", description="First parameter")
+        }
+    )
+    compact = schema.to_json(indent=None)
+    
+    assert "\n" not in compact
+    assert ", " not in compact and '": ' not in compact
+    assert json.loads(compact) == schema.to_dict()
+
+def test_meta_schema_is_read_only():
+    """Test that FUNCTION_META_SCHEMA cannot be modified"""
+    with pytest.raises(TypeError):
+        FUNCTION_META_SCHEMA["type"] = "array"
+    with pytest.raises(TypeError):
+        FUNCTION_META_SCHEMA["properties"]["name"]["type"] = "number"
+    with pytest.raises(AttributeError):
+        FUNCTION_META_SCHEMA["required"].append("extra")
+
+def test_function_meta_schema_returns_plain_data():
+    """Test that the plain-data meta-schema serializes, copies and is independent"""
+    import copy
+    
+    meta = function_meta_schema()
+    
+    assert json.loads(json.dumps(meta)) == meta
+    assert copy.deepcopy(meta) == meta
+    assert isinstance(meta["required"], list)
+    meta["required"].append("extra")
+    assert "extra" not in function_meta_schema()["required"]
+
+def test_function_meta_schema_works_with_jsonschema():
+    """Test that the optional jsonschema extra accepts the plain-data meta-schema"""
+    jsonschema = pytest.importorskip("jsonschema")
+    schema = Schema(
+        name="test_function",
+        description="A test function schema",
+        properties={"param1": SchemaProperty(type_="string", description="First parameter")}
+    )
+    jsonschema.validate(schema.to_dict(), function_meta_schema())
+
+def test_validate_function_checks_meta_schema():
+    """Test that VALIDATE_FUNCTION accepts schemas and reports the failing path"""
+    schema = Schema(
+        name="test_function",
+        description="A test function schema",
+        properties={
+            "param1": SchemaProperty(type_="string", description="First parameter")
+        }
+    )
+    VALIDATE_FUNCTION(schema.to_dict())
+    
+    data = json.loads(schema.to_json())
+    data["parameters"]["required"] = ["param1", 2]
+    with pytest.raises(ValueError, match=r"\$\.parameters\.required\[1\]"):
+        VALIDATE_FUNCTION(data)
+    
+    del data["parameters"]
+    with pytest.raises(ValueError, match="missing required property 'parameters'"):
+        VALIDATE_FUNCTION(data)
+
+def test_compile_validator_types_and_enum():
+    """Test type unions, enum membership and that booleans are not integers"""
+    validate = compile_validator({
+        "type": "object",
+        "properties": {
+            "count": {"type": "integer"},
+            "mode": {"type": ["string", "null"], "enum": ["fast", "slow", None]}
+        }
+    })
+    validate({"count": 3, "mode": None})
+    
+    with pytest.raises(ValueError, match=r"\$\.count: expected integer"):
+        validate({"count": True})
+    with pytest.raises(ValueError, match="must be one of"):
+        validate({"mode": "medium"})